@@ -10,16 +10,22 @@ FastMCP std-IO server exposing:
 # from __future__ import annotations
 
 import asyncio
-import textwrap
+import collections
+import functools
+import json
+import os
+import random
+import string
+import subprocess
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from fuzzywuzzy import process
 import httpx
-from git import Repo
 from mcp.server.fastmcp import FastMCP
 # from mcp.server.fastmcp.prompts import base
 from mcp.server.fastmcp.prompts.base import UserMessage, Message
-from ruamel.yaml import YAML
 from edge_tts import VoicesManager
 
 
@@ -71,20 +77,70 @@ def _get_lang_code(lang_name: str) -> Optional[str]:
 # ─────────────────────────────
 ORG = "TaskBeacon"
 CACHE = Path("./task_cache"); 
-NON_TASK_REPOS = {"task-registry", ".github","psyflow","taskbeacon-mcp","community","taskbeacon.github.io"}
+REPOS_TTL = 300     # seconds before the repo list / org snapshot is refetched
+README_TTL = 600    # seconds a cached README is served without revalidation
+README_BYTES = 2000 # README prefix requested for menu snippets
+WARM_TIMEOUT = 1    # max seconds a tool waits for the start-up warm-up (~1 API round trip)
+NON_TASK_REPOS = frozenset(map(str.casefold, {"task-registry", ".github","psyflow","taskbeacon-mcp","community","taskbeacon.github.io"}))
 
-yaml = YAML(); yaml.indent(mapping=2, sequence=4, offset=2)
+# ─────────────────────────────
+# HTTP clients (shared, keep-alive + HTTP/2)
+# ─────────────────────────────
+_GH_HEADERS = {"Accept": "application/vnd.github+json"}
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+def _make_clients() -> Tuple[httpx.AsyncClient, httpx.AsyncClient]:
+    api = httpx.AsyncClient(
+        base_url="https://api.github.com", http2=True,
+        headers=_GH_HEADERS, limits=_LIMITS, timeout=30,
+    )
+    raw = httpx.AsyncClient(
+        base_url="https://raw.githubusercontent.com", http2=True,
+        limits=_LIMITS, timeout=30,
+    )
+    return api, raw
+
+CLIENT, RAW_CLIENT = _make_clients()
+
+# cap in-flight GitHub requests; list_tasks fans out ~2 calls per repo
+SEM = asyncio.Semaphore(64)
+
+# API tokens, rotated per request: GH_TOKENS="tok1,tok2,..." (or a single GH_TOKEN)
+TOKENS = collections.deque(
+    t.strip() for t in os.getenv("GH_TOKENS", os.getenv("GH_TOKEN", "")).split(",") if t.strip()
+)
+_token_cooldown: Dict[str, float] = {}  # token → time it may be used again
+
+_warm_task: Optional[asyncio.Task] = None
+_sessions = 0  # open lifespans; SSE enters one per connected client
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    global CLIENT, RAW_CLIENT, _warm_task, _sessions
+    _sessions += 1
+    if _sessions == 1:
+        if CLIENT.is_closed or RAW_CLIENT.is_closed:
+            CLIENT, RAW_CLIENT = _make_clients()
+        _warm_task = asyncio.create_task(_warm_cache())
+    try:
+        yield
+    finally:
+        _sessions -= 1
+        if _sessions == 0:
+            _warm_task.cancel()
+            await CLIENT.aclose()
+            await RAW_CLIENT.aclose()
 
 # ─────────────────────────────
 # FastMCP instance
 # ─────────────────────────────
-mcp = FastMCP(name="psyflow-mcp")
+mcp = FastMCP(name="psyflow-mcp", lifespan=_lifespan)
 
 # ═════════════════════════════
 # Prompts
 # ═════════════════════════════
-_PROMPT_TEMPLATE = textwrap.dedent('''
-Turn my existing {source_task} implementation in PsyFlow/TAPs into a {target_task} task with as few changes as possible.
+_PROMPT_TEMPLATE = string.Template('''\
+Turn my existing ${source_task} implementation in PsyFlow/TAPs into a ${target_task} task with as few changes as possible.
 
 **Key requirements:**
 - The unit for all stimuli sizes must be in \'deg\' (degrees of visual angle).
@@ -95,17 +151,17 @@ Turn my existing {source_task} implementation in PsyFlow/TAPs into a {target_tas
 Breakdown:
 
 Stage 0: Plan
-* Read literature and figure out what a typical {target_task} task looks like.
+* Read literature and figure out what a typical ${target_task} task looks like.
 * Define the flow: blocks → trials → events.
 * Identify stimulus types (ensuring sizes are in \'deg\'), response keys, timing parameters, and key output fields.
 
 Stage 1: config.yaml
-* Adapt the existing config.yaml to run a {target_task} task.
+* Adapt the existing config.yaml to run a ${target_task} task.
 * Ensure all stimulus sizes are defined in \'deg\' and are of an appropriate size for a typical screen.
 * Highlight any parameters that need careful review.
 
 Stage 2: Trial logic (src/run_trial.py)
-* Adapt one existing trial template to run a single {target_task} trial.
+* Adapt one existing trial template to run a single ${target_task} trial.
 * (Optional) If needed, add helpers in src/utils.py; otherwise skip.
 
 Stage 3: Block/session logic (main.py)
@@ -115,7 +171,7 @@ Stage 3: Block/session logic (main.py)
 
 Stage 4: Asset handling
 * Identify and list for removal all `_voice.mp3` files from the `assets/` directory.
-* Identify and list for removal any other files in `assets/` not relevant to the new {target_task}.
+* Identify and list for removal any other files in `assets/` not relevant to the new ${target_task}.
 
 Stage 5: README.md
 * Match the structure and tone of existing tasks.
@@ -130,14 +186,15 @@ Stage 6: Static validation
 * Verify naming, docstrings, and imports follow PsyFlow conventions.
 * Spot any logic errors or unused variables.
 
-(No PsychoPy runtime or unit tests are required during this step)
-''').strip()
+(No PsychoPy runtime or unit tests are required during this step)''')
+
+@functools.lru_cache(maxsize=256)
+def _format_prompt(source_task: str, target_task: str) -> str:
+    return _PROMPT_TEMPLATE.substitute(source_task=source_task, target_task=target_task)
 
 @mcp.prompt(title="Task Transformation Prompt")
 def transform_prompt(source_task: str, target_task: str) -> UserMessage:
-    return UserMessage(_PROMPT_TEMPLATE.format(
-        source_task=source_task, target_task=target_task
-    ))
+    return UserMessage(_format_prompt(source_task, target_task))
 
 
 @mcp.prompt(title="Localize task")
@@ -227,7 +284,7 @@ def choose_repo_prompt(
         The user's natural language query for the desired task/repository.
     candidates : list[dict]
         Each dict must have:
-          { "repo": "<name>", "readme_snippet": "<first 2000 chars>" }
+          { "repo": "<name>", "readme_snippet": "<first 2000 bytes>" }
     '''
     intro = (
         "You are given a user's query for a task/repository and a list of "
@@ -252,27 +309,330 @@ def choose_repo_prompt(
 # ═════════════════════════════
 # HELPERS
 # ═════════════════════════════
+def _is_rate_limited(r: httpx.Response) -> bool:
+    if r.status_code == 429:
+        return True
+    return r.status_code == 403 and (
+        "Retry-After" in r.headers or r.headers.get("X-RateLimit-Remaining") == "0"
+    )
+
+def _retry_delay(r: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited response."""
+    backoff = 2 ** attempt
+    if "Retry-After" in r.headers:
+        try:
+            return float(r.headers["Retry-After"]) + random.random()
+        except ValueError:
+            pass
+    if "X-RateLimit-Reset" in r.headers:
+        reset = int(r.headers["X-RateLimit-Reset"]) - time.time()
+        backoff = min(max(reset, 0), backoff)
+    return backoff + random.random()
+
+def _cooldown_until(r: httpx.Response) -> float:
+    """Epoch time at which the token behind a rate-limited response recovers."""
+    if "X-RateLimit-Reset" in r.headers and r.headers.get("X-RateLimit-Remaining") == "0":
+        return float(r.headers["X-RateLimit-Reset"])
+    try:
+        return time.time() + float(r.headers.get("Retry-After", 60))
+    except ValueError:
+        return time.time() + 60
+
+def _next_token() -> Optional[str]:
+    '''Round-robin over TOKENS, skipping those cooling down after a rate limit.'''
+    if not TOKENS:
+        return None
+    now = time.time()
+    for _ in range(len(TOKENS)):
+        tok = TOKENS[0]; TOKENS.rotate(-1)
+        if _token_cooldown.get(tok, 0) <= now:
+            return tok
+    return min(TOKENS, key=lambda t: _token_cooldown[t])  # all limited: soonest reset
+
+async def _request_with_retry(client: httpx.AsyncClient, method: str, url: str, tries: int = 5, **kwargs) -> httpx.Response:
+    '''
+    Send through the shared semaphore, backing off on GitHub's primary /
+    secondary rate limits (403/429 + Retry-After or X-RateLimit-Reset).
+    API calls rotate through TOKENS; a rate-limited token is benched until
+    it resets and the request moves to the next one without sleeping.
+    '''
+    headers = dict(kwargs.pop("headers", {}))
+    for attempt in range(tries):
+        tok = _next_token() if client is CLIENT else None
+        if tok:
+            headers["Authorization"] = f"Bearer {tok}"
+        async with SEM:
+            r = await client.request(method, url, headers=headers, **kwargs)
+        if not _is_rate_limited(r) or attempt == tries - 1:
+            return r
+        if tok:
+            _token_cooldown[tok] = _cooldown_until(r)
+            if any(_token_cooldown.get(t, 0) <= time.time() for t in TOKENS):
+                continue
+        await asyncio.sleep(_retry_delay(r, attempt))
+    return r
+
+async def _get_with_retry(client: httpx.AsyncClient, url: str, tries: int = 5, **kwargs) -> httpx.Response:
+    return await _request_with_retry(client, "GET", url, tries, **kwargs)
+
+# ─────────────────────────────
+# ETag cache: in-memory, backed by CACHE/_meta/<repo>.json
+# ─────────────────────────────
+META = CACHE / "_meta"
+README_CACHE: Dict[str, Tuple[str, str]] = {}          # repo → (etag, body); ("", "") = no README
+BRANCH_CACHE: Dict[str, Tuple[str, List[str]]] = {}    # repo → (etag, names)
+_readme_checked: Dict[str, float] = {}                 # repo → last fetch / 304
+_meta_loaded = False
+
+def _load_meta() -> None:
+    global _meta_loaded
+    if _meta_loaded:
+        return
+    _meta_loaded = True
+    for f in META.glob("*.json"):
+        try:
+            meta = json.loads(f.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if "readme" in meta:
+            README_CACHE[f.stem] = tuple(meta["readme"])
+            _readme_checked[f.stem] = f.stat().st_mtime
+        if "branches" in meta:
+            BRANCH_CACHE[f.stem] = tuple(meta["branches"])
+
+def _save_meta(repo: str) -> None:
+    meta = {}
+    if repo in README_CACHE:
+        meta["readme"] = README_CACHE[repo]
+    if repo in BRANCH_CACHE:
+        meta["branches"] = BRANCH_CACHE[repo]
+    META.mkdir(parents=True, exist_ok=True)
+    (META / f"{repo}.json").write_text(json.dumps(meta), encoding="utf-8")
+
+async def _conditional_get(client: httpx.AsyncClient, url: str, cached: Optional[tuple], **kwargs) -> httpx.Response:
+    # an authenticated 304 against a known ETag does not count towards
+    # GitHub's rate limit (anonymous 304s still do)
+    headers = dict(kwargs.pop("headers", {}))
+    if cached and cached[0]:  # ("", "") marks a known-missing file
+        headers["If-None-Match"] = cached[0]
+    return await _get_with_retry(client, url, headers=headers, **kwargs)
+
+async def get_readme(repo: str) -> str:
+    '''
+    Leading README_BYTES of `repo`'s README.md ("" if missing). Served
+    from cache for README_TTL seconds, then revalidated by ETag; the
+    cached body is kept if revalidation fails.
+    '''
+    _load_meta()
+    cached = README_CACHE.get(repo)
+    if cached and time.time() - _readme_checked.get(repo, 0) < README_TTL:
+        return cached[1]
+    r = await _conditional_get(
+        RAW_CLIENT, f"/{ORG}/{repo}/main/README.md", cached,
+        headers={"Range": f"bytes=0-{README_BYTES - 1}"}, timeout=10,
+    )
+    if r.status_code == 304 and cached:
+        _readme_checked[repo] = time.time()
+        return cached[1]
+    if r.status_code == 404:
+        # no README: remember that for README_TTL instead of refetching per menu
+        README_CACHE[repo] = ("", "")
+        _readme_checked[repo] = time.time()
+        _save_meta(repo)
+        return ""
+    if r.status_code not in (200, 206):
+        # rate limited / server error: a stale body beats an empty menu
+        return cached[1] if cached else ""
+    # the byte range may split a multi-byte character at its end
+    text = r.content[:README_BYTES].decode("utf-8", errors="ignore")
+    if "ETag" in r.headers:
+        README_CACHE[repo] = (r.headers["ETag"], text)
+        _readme_checked[repo] = time.time()
+        _save_meta(repo)
+    return text
+
+# ─────────────────────────────
+# GraphQL org snapshot: names + README + branches in one round trip
+# ─────────────────────────────
+_ORG_QUERY = '''
+query($org: String!) {
+  organization(login: $org) {
+    repositories(first: 100) {
+      nodes {
+        name
+        refs(refPrefix: "refs/heads/", first: 20) { nodes { name } }
+        object(expression: "main:README.md") { ... on Blob { text } }
+      }
+    }
+  }
+}
+'''
+_snapshot: Optional[Tuple[float, Optional[Dict[str, Dict]]]] = None  # None body = last query failed
+_snapshot_lock = asyncio.Lock()  # one GraphQL query in flight, however many callers
+
+async def _org_snapshot() -> Optional[Dict[str, Dict]]:
+    '''
+    Every org repo as repo → {readme, branches}, refetched after REPOS_TTL.
+    Returns None when GraphQL is unavailable (it requires GH_TOKEN) so
+    callers can fall back to the REST endpoints; a failed query is also
+    remembered for REPOS_TTL so the fallback does not retry it each call.
+    '''
+    if _snapshot is not None and time.time() - _snapshot[0] < REPOS_TTL:
+        return _snapshot[1]
+    if not TOKENS:
+        return None
+    async with _snapshot_lock:
+        # another caller may have refreshed it while we waited
+        if _snapshot is not None and time.time() - _snapshot[0] < REPOS_TTL:
+            return _snapshot[1]
+        return await _fetch_org_snapshot()
+
+async def _fetch_org_snapshot() -> Optional[Dict[str, Dict]]:
+    global _snapshot
+    r = await _request_with_retry(
+        CLIENT, "POST", "/graphql", json={"query": _ORG_QUERY, "variables": {"org": ORG}}
+    )
+    org = ((r.json() if r.status_code == 200 else {}).get("data") or {}).get("organization")
+    if not org:
+        _snapshot = (time.time(), None)
+        return None
+    nodes = {
+        n["name"]: {
+            "readme": (n.get("object") or {}).get("text") or "",
+            "branches": [b["name"] for b in (n.get("refs") or {}).get("nodes", [])],
+        }
+        for n in org["repositories"]["nodes"]
+    }
+    _snapshot = (time.time(), nodes)
+    return nodes
+
+async def readme_snippet(repo: str, snapshot: Optional[Dict[str, Dict]]) -> str:
+    '''
+    First README_BYTES of `repo`'s README (UTF-8) on one line, taken from the
+    caller's org `snapshot` when it has the repo, else from get_readme().
+    Shared by every tool, so whichever call fetched a README first serves
+    the others.
+    '''
+    if snapshot is not None and repo in snapshot:
+        readme = snapshot[repo]["readme"]
+    else:
+        readme = await get_readme(repo)
+    # same byte budget on both paths; GraphQL returns the full README text
+    readme = readme.encode("utf-8")[:README_BYTES].decode("utf-8", errors="ignore")
+    return readme.replace("\n", " ")
+
 async def _github_repos() -> List[dict]:
-    url = f"https://api.github.com/orgs/{ORG}/repos?per_page=100"
-    async with httpx.AsyncClient() as c:
-        r = await c.get(url, timeout=30); r.raise_for_status()
+    r = await _get_with_retry(CLIENT, f"/orgs/{ORG}/repos?per_page=100"); r.raise_for_status()
     return r.json()
 
 async def _repo_branches(repo: str) -> List[str]:
-    url = f"https://api.github.com/repos/{ORG}/{repo}/branches?per_page=100"
-    async with httpx.AsyncClient() as c:
-        r = await c.get(url, timeout=15)
-    return [b["name"] for b in r.json()][:20]  # cap at 10
+    _load_meta()
+    cached = BRANCH_CACHE.get(repo)
+    r = await _conditional_get(CLIENT, f"/repos/{ORG}/{repo}/branches?per_page=20", cached, timeout=15)
+    if r.status_code == 304 and cached:
+        return cached[1]
+    names = [b["name"] for b in r.json()]  # first page only: up to 20
+    if "ETag" in r.headers:
+        BRANCH_CACHE[repo] = (r.headers["ETag"], names)
+        _save_meta(repo)
+    return names
+
+_repos_cache: Optional[Tuple[float, List[str]]] = None
 
 async def task_repos() -> List[str]:
-    return [r["name"] for r in await _github_repos() if r["name"] not in NON_TASK_REPOS]
+    global _repos_cache
+    if _repos_cache is not None and time.time() - _repos_cache[0] < REPOS_TTL:
+        return list(_repos_cache[1])
+    snapshot = await _org_snapshot()
+    if snapshot is not None:
+        names = [n for n in snapshot if n.casefold() not in NON_TASK_REPOS]
+    else:
+        names = [r["name"] for r in await _github_repos() if r["name"].casefold() not in NON_TASK_REPOS]
+    _repos_cache = (time.time(), names)
+    return list(names)
+
+async def _snippet(repo: str, snapshot: Optional[Dict[str, Dict]]) -> Dict:
+    return {"repo": repo, "readme_snippet": await readme_snippet(repo, snapshot)}
+
+async def _task_entries() -> List[Dict]:
+    repos = await task_repos()
+
+    # single GraphQL round trip when authenticated
+    snapshot = await _org_snapshot()
+    if snapshot is not None:
+        return [
+            {"repo": r, "readme_snippet": await readme_snippet(r, snapshot), "branches": snapshot[r]["branches"]}
+            for r in repos if r in snapshot
+        ]
+
+    # REST fallback: README + branches per repo
+    async def build_entry(repo: str) -> Dict:
+        entry, branches = await asyncio.gather(_snippet(repo, None), _repo_branches(repo))
+        return {**entry, "branches": branches}
+
+    # gather concurrently for speed
+    return list(await asyncio.gather(*(build_entry(r) for r in repos)))
+
+async def _warm_cache() -> None:
+    '''
+    Prefetch repo list, READMEs and branches at server start. Without a
+    token only the repo list and raw READMEs are warmed: per-repo branch
+    calls would spend the 60/hour anonymous API quota on every restart.
+    '''
+    try:
+        if TOKENS:
+            await _task_entries()
+        else:
+            await asyncio.gather(*(get_readme(r) for r in await task_repos()))
+    except Exception:
+        pass  # best effort; tools fetch on demand
+
+async def _wait_warm() -> None:
+    # let a tool called during start-up share the in-flight warm-up
+    # instead of issuing the same requests twice
+    if _warm_task is not None and not _warm_task.done():
+        await asyncio.wait({_warm_task}, timeout=WARM_TIMEOUT)
 
 def clone(repo: str) -> Path:
     dest = CACHE / repo
     if dest.exists(): return dest
-    Repo.clone_from(f"https://github.com/{ORG}/{repo}.git", dest, depth=1)
+    # No --reference/alternates store: templates do not share commit history
+    # (with psyflow or each other), so git negotiation would reuse nothing.
+    try:
+        subprocess.run(
+            ["git", "clone", "--depth=1", "--single-branch", "--no-tags",
+             f"https://github.com/{ORG}/{repo}.git", str(dest)],
+            check=True, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            # never prompt for credentials: stdin is the MCP JSON-RPC stream
+            env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+        )
+    except subprocess.CalledProcessError as e:
+        reason = e.stderr.decode(errors="replace").strip()
+        raise RuntimeError(f"git clone of {repo} failed: {reason}") from e
     return dest
 
+_CLONED: Dict[str, asyncio.Task] = {}  # repo → clone task (running or finished)
+
+def _clone_stale(task: asyncio.Task) -> bool:
+    if not task.done():
+        return False  # in flight: share it
+    if task.cancelled() or task.exception() is not None:
+        return True
+    return not task.result().exists()
+
+async def clone_cached(repo: str) -> Path:
+    '''
+    `clone` memoized per process: concurrent callers share one in-flight
+    clone, and a repo already cloned is returned without a worker-thread
+    round trip. Re-clones after a failure or if the directory was removed
+    (the transform prompt asks the LLM to delete task_cache when done).
+    '''
+    task = _CLONED.get(repo)
+    if task is None or _clone_stale(task):
+        task = _CLONED[repo] = asyncio.ensure_future(asyncio.to_thread(clone, repo))
+    # shield: one cancelled caller must not abort the clone for the others
+    return await asyncio.shield(task)
+
 
 async def _list_supported_voices_async(filter_lang: Optional[str] = None):
     vm = await VoicesManager.create()
@@ -335,31 +695,28 @@ async def build_task(target_task: str, source_task: Optional[str] = None) -> Dic
     • Without `source_task` → send `choose_template_prompt` so the LLM picks.
     '''
     CACHE.mkdir(exist_ok=True)
+    await _wait_warm()
     repos = await task_repos()
 
     # branch 1 : explicit source
     if source_task:
-        repo = next((r for r in repos if source_task.lower() in r.lower()), None)
+        needle = source_task.casefold()
+        repo = next((r for r in repos if needle in r.casefold()), None)
         if not repo:
             raise ValueError("Template repo not found.")
-        path = await asyncio.to_thread(clone, repo)
+        path = await clone_cached(repo)
         return {
             "prompt": transform_prompt(source_task, target_task).content,
             "template_path": str(path),
         }
 
     # branch 2 : no source → build menu
-    snippets = []
-    for repo in repos:
-        url = f"https://raw.githubusercontent.com/{ORG}/{repo}/main/README.md"
-        async with httpx.AsyncClient() as c:
-            rd = await c.get(url, timeout=10)
-        snippet = rd.text[:2000].replace("\n", " ") if rd.status_code == 200 else ""
-        snippets.append({"repo": repo, "readme_snippet": snippet})
+    snapshot = await _org_snapshot()
+    snippets = await asyncio.gather(*(_snippet(r, snapshot) for r in repos))
 
     msgs = choose_template_prompt(f"A {target_task} task.", snippets)
     return {
-        "prompt_messages": [m.dict() for m in msgs],
+        "prompt_messages": [m.model_dump() for m in msgs],
         "note": "Reply with chosen repo, then call build_task again with source_task=<repo>.",
     }
 
@@ -371,25 +728,21 @@ async def download_task(repo: str) -> Dict:
     use an LLM to select the best matching repository.
     '''
     CACHE.mkdir(exist_ok=True)
+    await _wait_warm()
     all_repos = await task_repos()
 
     # Check for exact match first
     if repo in all_repos:
-        path = await asyncio.to_thread(clone, repo)
+        path = await clone_cached(repo)
         return {"template_path": str(path)}
 
     # If not an exact match, use LLM to select the best repo
-    snippets = []
-    for r_name in all_repos:
-        readme_url = f"https://raw.githubusercontent.com/{ORG}/{r_name}/main/README.md"
-        async with httpx.AsyncClient() as c:
-            rd = await c.get(readme_url, timeout=10)
-        snippet = rd.text[:2000].replace("\n", " ") if rd.status_code == 200 else ""
-        snippets.append({"repo": r_name, "readme_snippet": snippet})
+    snapshot = await _org_snapshot()
+    snippets = await asyncio.gather(*(_snippet(r, snapshot) for r in all_repos))
 
     msgs = choose_repo_prompt(repo, snippets)
     return {
-        "prompt_messages": [m.dict() for m in msgs],
+        "prompt_messages": [m.model_dump() for m in msgs],
         "note": "Reply with chosen repo, then call download_task again with the selected repo name.",
     }
 
@@ -420,7 +773,7 @@ async def localize(task_path: str, target_language: str, voice: Optional[str] =
         voice_options = await list_voices(filter_lang=lang_code)
 
     msgs = localize_prompt(yaml_text, target_language, voice_options)
-    return {"prompt_messages": [m.dict() for m in msgs]}
+    return {"prompt_messages": [m.model_dump() for m in msgs]}
 
 @mcp.tool()
 async def list_voices(filter_lang: Optional[str] = None) -> str:
@@ -436,24 +789,11 @@ async def list_tasks() -> List[Dict]:
     Return metadata for every task template repo:
 
       • repo              – repository name
-      • readme_snippet    – first 2000 characters of README.md
-      • branches          – up to 10 branch names
+      • readme_snippet    – first 2000 bytes (UTF-8) of README.md
+      • branches          – up to 20 branch names
     '''
-    repos = await task_repos()
-    results: List[Dict] = []
-
-    async def build_entry(repo: str) -> Dict:
-        readme_url = f"https://raw.githubusercontent.com/{ORG}/{repo}/main/README.md"
-        async with httpx.AsyncClient() as c:
-            rd = await c.get(readme_url, timeout=10)
-        snippet = rd.text[:2000].replace("\n", " ") if rd.status_code == 200 else ""
-        branches = await _repo_branches(repo)
-        return {"repo": repo, "readme_snippet": snippet, "branches": branches}
-
-    # gather concurrently for speed
-    entries = await asyncio.gather(*(build_entry(r) for r in repos))
-    results.extend(entries)
-    return results
+    await _wait_warm()
+    return await _task_entries()
 
 # ═════════════════════════════
 # MAIN